@@ -1,19 +1,103 @@
 import argparse
+import asyncio
+import gc
 import logging
 import os
+import re
+import threading
+import time
+import unicodedata
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
+import aiohttp
+import lxml.etree
+import lxml.html
 import pandas as pd
-from bs4 import BeautifulSoup
 from requests.exceptions import ConnectionError
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
+from simhash import Simhash, SimhashIndex
 from urllib3.exceptions import ProtocolError
 from webdriver_manager.chrome import ChromeDriverManager
 
+# Headers sent with plain HTTP requests, some sites reject the default user agent
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/116.0.0.0 Safari/537.36"
+    ),
+}
+
+# Chrome content settings, a value of 2 blocks the resource type
+CHROME_CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+}
+
+# Number of article URLs fetched and stored at a time, bounding memory use on large
+# listings. Can be overridden with the URL_BATCH_SIZE environment variable.
+URL_BATCH_SIZE = int(os.environ.get("URL_BATCH_SIZE", 50))
+
+# HTTP statuses worth retrying, anything else is treated as a permanent failure
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Columns of the stored article data
+ARTICLE_COLUMNS = [
+    "title",
+    "article_id",
+    "content",
+    "url",
+    "author",
+    "date_published",
+    "source",
+    "simhash",
+]
+
+# Maximum Hamming distance between two title SimHashes to treat them as duplicates
+SIMHASH_DISTANCE = 3
+
+# Parser used to build lxml trees from the raw page HTML. Comments and processing
+# instructions are never needed by the extractors, so they are dropped while
+# parsing instead of being materialised as tree nodes.
+HTML_PARSER = lxml.html.HTMLParser(
+    remove_comments=True,
+    remove_pis=True,
+    collect_ids=False,
+)
+
+
+def has_class(class_name):
+    """
+    Builds an XPath predicate matching elements whose class list contains class_name.
+
+    :param class_name: The CSS class to match.
+    :return: XPath predicate string.
+    """
+    return "contains(concat(' ', normalize-space(@class), ' '), ' {} ')".format(
+        class_name
+    )
+
+
+def compute_title_simhash(title):
+    """
+    Computes the SimHash fingerprint of an article title.
+
+    :param title: Title of the article.
+    :return: 64-bit SimHash of the normalized title, as a hex string, or None if the
+        title has no words to fingerprint.
+    """
+    normalized_title = unicodedata.normalize("NFKC", title).lower()
+    title_tokens = re.findall(r"\w+", normalized_title)
+    # Every token-less title would hash to 0 and match every other one
+    if not title_tokens:
+        return None
+    return format(Simhash(title_tokens).value, "016x")
+
 
 # Base exception class
 class BaseException(Exception):
@@ -52,78 +136,141 @@ class ArticleSource(Enum):
 
 # Abstract Base Class for articles
 class BaseArticles(ABC):
+    # Markup that must be present in an article page for it to be complete
+    required_markup = ()
+
     def __init__(self):
         """
         Initialize the BaseArticle class.
         """
 
-    def fetch_articles(self, scraper, html_content, source: ArticleSource):
+    async def fetch_articles(
+        self, scraper, article_urls, source: ArticleSource, batch_size=URL_BATCH_SIZE
+    ):
         """
-        Fetches and extracts articles from the web page.
+        Fetches and extracts articles from their web pages, one batch at a time.
 
         :param scraper: The scraper object to retrieve article pages.
-        :param html_content: The HTML content of the page.
+        :param article_urls: URLs of the articles to fetch.
         :param source: The source of the articles.
-        :return: A list of dictionaries, each containing article information.
+        :param batch_size: Number of articles fetched concurrently per batch.
+        :return: Async generator of lists of dictionaries, each containing article
+            information.
         """
-        soup = BeautifulSoup(html_content, "html.parser")
-        article_urls = self.extract_article_urls(soup)
+        # Article pages are requested concurrently on the event loop, while Selenium
+        # fallbacks run in a thread pool where each thread reuses its own driver
+        connector = aiohttp.TCPConnector(limit=scraper.max_connections)
+        timeout = aiohttp.ClientTimeout(total=scraper.http_timeout)
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers=HTTP_HEADERS
+        ) as session:
+            with ThreadPoolExecutor(max_workers=scraper.max_workers) as executor:
+                for start in range(0, len(article_urls), batch_size):
+                    articles = await asyncio.gather(
+                        *(
+                            self.fetch_article(
+                                scraper, session, executor, article_url, source
+                            )
+                            for article_url in article_urls[start : start + batch_size]
+                        )
+                    )
+
+                    yield [article for article in articles if article]
+
+    async def fetch_article(
+        self, scraper, session, executor, article_url, source: ArticleSource
+    ):
+        """
+        Fetches a single article page and extracts its information.
 
-        articles_data = []
+        :param scraper: The scraper object to retrieve the article page.
+        :param session: The aiohttp session used for plain HTTP requests.
+        :param executor: The thread pool used to run Selenium fallbacks.
+        :param article_url: URL of the article.
+        :param source: The source of the article.
+        :return: Dictionary containing article information, or None if the page
+            couldn't be retrieved.
+        """
+        # Try a plain HTTP request first and only fall back to Selenium when the
+        # article needs JavaScript to render its content
+        article_page = await scraper.get_page_http(session, article_url)
+        if article_page is None or not self.is_complete_page(article_page):
+            loop = asyncio.get_running_loop()
+            article_page = await loop.run_in_executor(
+                executor, scraper.get_page, article_url
+            )
+        if article_page is None:
+            return None
 
-        # Loop through each article URL and extract article information
-        for article_url in article_urls:
-            # Retrieve the content of the individual article page using the existing get_page function
-            article_page = scraper.get_page(article_url, headless=True)
-            article_soup = BeautifulSoup(article_page, "html.parser")
+        article_tree = lxml.html.fromstring(article_page, parser=HTML_PARSER)
 
-            # exctract article element and add it to dictionary
-            article = {}
-            article["title"] = self.extract_article_title(article_soup, article_url)
-            article["article_id"] = self.extract_article_id(article_url)
-            article["content"] = self.extract_article_content_text(
-                article_soup, article_url
-            )
-            article["url"] = article_url
-            article["author"] = self.extract_article_author(article_soup, article_url)
-            article["date_published"] = self.extract_article_date(
-                article_soup, article_url
-            )
-            article["source"] = source.value
+        # exctract article elements into a dictionary
+        article = self.extract_all(article_tree, article_url)
+        article["source"] = source.value
+        article["simhash"] = compute_title_simhash(article["title"])
+
+        return article
+
+    def is_complete_page(self, article_page):
+        """
+        Checks whether an article page contains all the markup needed for extraction.
 
-            if article:
-                articles_data.append(article)
+        :param article_page: HTML content of the article page.
+        :return: True if the page can be extracted without rendering JavaScript.
+        """
+        return all(markup in article_page for markup in self.required_markup)
 
-        return articles_data
+    def extract_all(self, article_tree, article_url):
+        """
+        Extracts all the information of the article from the web page.
+
+        Sources can override this to collect every field in a single pass over the
+        tree instead of running each extractor separately.
+
+        :param article_tree: lxml tree of the web page content.
+        :param article_url: URL of the article.
+        :return: Dictionary containing article information.
+        """
+        article = {}
+        article["title"] = self.extract_article_title(article_tree, article_url)
+        article["article_id"] = self.extract_article_id(article_url)
+        article["content"] = self.extract_article_content_text(
+            article_tree, article_url
+        )
+        article["url"] = article_url
+        article["author"] = self.extract_article_author(article_tree, article_url)
+        article["date_published"] = self.extract_article_date(article_tree, article_url)
+
+        return article
 
     @abstractmethod
-    def extract_article_title(self, article_soup, article_url):
+    def extract_article_title(self, article_tree, article_url):
         """
         Extracts the title of the article from the web page.
 
-        :param article_soup: BeautifulSoup object of the web page content.
+        :param article_tree: lxml tree of the web page content.
         :param article_url: URL of the article.
         :return: Title of the article.
         """
         pass
 
     @abstractmethod
-    def extract_article_date(self, article_soup, article_url):
+    def extract_article_date(self, article_tree, article_url):
         """
         Extracts the date of the article from the web page.
 
-        :param article_soup: BeautifulSoup object of the web page content.
+        :param article_tree: lxml tree of the web page content.
         :param article_url: URL of the article.
         :return: Date of the article.
         """
         pass
 
     @abstractmethod
-    def extract_article_author(self, article_soup, article_url):
+    def extract_article_author(self, article_tree, article_url):
         """
         Extracts the author of the article from the web page.
 
-        :param article_soup: BeautifulSoup object of the web page content.
+        :param article_tree: lxml tree of the web page content.
         :param article_url: URL of the article.
         :return: Author of the article.
         """
@@ -140,64 +287,144 @@ class BaseArticles(ABC):
         pass
 
     @abstractmethod
-    def extract_article_content_text(self, article_soup, article_url):
+    def extract_article_content_text(self, article_tree, article_url):
         """
         Extracts the content of the article from the web page.
 
-        :param article_soup: BeautifulSoup object of the web page content.
+        :param article_tree: lxml tree of the web page content.
         :param article_url: URL of the article.
         :return: Content of the article.
         """
         pass
 
     @abstractmethod
-    def extract_article_urls(self, soup):
+    def extract_article_urls(self, tree):
         """
         Extracts a list of article URLs from the web page.
 
-        :param soup: BeautifulSoup object of the web page content.
+        :param tree: lxml tree of the web page content.
         :return: List of article URLs.
         """
         pass
 
 
+# XPath queries used by the TechCrunch extractors, compiled once at import time
+TECHCRUNCH_TITLE_XPATH = lxml.etree.XPath(
+    "//h1[{}]".format(has_class("article__title"))
+)
+TECHCRUNCH_DATE_XPATH = lxml.etree.XPath(
+    "//time[{}]".format(has_class("full-date-time"))
+)
+TECHCRUNCH_AUTHOR_XPATH = lxml.etree.XPath(
+    "//span[{}]".format(has_class("river-byline__authors"))
+)
+TECHCRUNCH_CONTENT_XPATH = lxml.etree.XPath(
+    "//div[{}]".format(has_class("article-content"))
+)
+TECHCRUNCH_URLS_XPATH = lxml.etree.XPath(
+    "//a[{}]".format(has_class("post-block__title__link"))
+)
+TECHCRUNCH_FIELDS_XPATH = lxml.etree.XPath(
+    "//*[(self::h1 and {}) or (self::time and {}) or (self::span and {})"
+    " or (self::div and {})]".format(
+        has_class("article__title"),
+        has_class("full-date-time"),
+        has_class("river-byline__authors"),
+        has_class("article-content"),
+    )
+)
+PARAGRAPHS_XPATH = lxml.etree.XPath(".//p")
+
+
 # Class for TechCrunch articles, inheriting from BaseArticles
 class TechCrunchArticles(BaseArticles):
-    def extract_article_title(self, article_soup, article_url):
+    required_markup = (
+        "article__title",
+        "full-date-time",
+        "river-byline__authors",
+        "article-content",
+    )
+
+    def extract_all(self, article_tree, article_url):
+        """
+        Extracts all the information of the article in a single pass over the tree.
+
+        :param article_tree: lxml tree of the web page content.
+        :param article_url: URL of the article.
+        :return: Dictionary containing article information.
+        """
+        # One XPath walk matches the elements of every field, in document order
+        tags = {"h1": [], "time": [], "span": [], "div": []}
+        for element in TECHCRUNCH_FIELDS_XPATH(article_tree):
+            tags[element.tag].append(element)
+
+        article = {}
+        article["title"] = self.parse_article_title(tags["h1"], article_url)
+        article["article_id"] = self.extract_article_id(article_url)
+        article["content"] = self.parse_article_content_text(tags["div"], article_url)
+        article["url"] = article_url
+        article["author"] = self.parse_article_author(tags["span"], article_url)
+        article["date_published"] = self.parse_article_date(tags["time"], article_url)
+
+        return article
+
+    def extract_article_title(self, article_tree, article_url):
         """
         Extracts the title of the article from the web page.
 
-        :param article_soup: BeautifulSoup object of the web page content.
+        :param article_tree: lxml tree of the web page content.
+        :param article_url: URL of the article.
+        :return: Title of the article.
+        :raises NoArticleTitleFound: when an article's title wasn't found.
+        """
+        return self.parse_article_title(
+            TECHCRUNCH_TITLE_XPATH(article_tree), article_url
+        )
+
+    def parse_article_title(self, tag_title, article_url):
+        """
+        Gets the title of the article from its matched title elements.
+
+        :param tag_title: List of matched title elements.
         :param article_url: URL of the article.
         :return: Title of the article.
         :raises NoArticleTitleFound: when an article's title wasn't found.
         """
-        tag_title = article_soup.find("h1", class_="article__title")
         if not tag_title:
             logging.warning("Article title element not found.")
             raise NoArticleTitleFound(
                 "No title found for article: {}".format(article_url)
             )
 
-        return tag_title.get_text().strip()
+        return tag_title[0].text_content().strip()
 
-    def extract_article_date(self, article_soup, article_url):
+    def extract_article_date(self, article_tree, article_url):
         """
         Extracts the date of the article from the web page.
 
-        :param article_soup: BeautifulSoup object of the web page content.
+        :param article_tree: lxml tree of the web page content.
+        :param article_url: URL of the article.
+        :return: Date of the article.
+        :raises NoArticleDateFound: when an article's date wasn't found.
+        """
+        return self.parse_article_date(TECHCRUNCH_DATE_XPATH(article_tree), article_url)
+
+    def parse_article_date(self, tag_date, article_url):
+        """
+        Gets the date of the article from its matched date elements.
+
+        :param tag_date: List of matched date elements.
         :param article_url: URL of the article.
         :return: Date of the article.
         :raises NoArticleDateFound: when an article's date wasn't found.
         """
-        tag_date = article_soup.find("time", class_="full-date-time")
         if not tag_date:
             logging.warning("Article date element not found.")
             raise NoArticleDateFound(
                 "No date found for article: {}".format(article_url)
             )
 
-        date_text = tag_date.get_text(strip=True)
+        date_text = "".join(text.strip() for text in tag_date[0].itertext())
 
         try:
             # Split the date_text using the '•' character
@@ -215,33 +442,57 @@ class TechCrunchArticles(BaseArticles):
 
         return date_text
 
-    def extract_article_author(self, article_soup, article_url):
+    def extract_article_author(self, article_tree, article_url):
         """
         Extracts the author of the article from the web page.
 
-         :param article_soup: BeautifulSoup object of the web page content.
+         :param article_tree: lxml tree of the web page content.
          :param article_url: URL of the article.
          :return: Author of the article.
          :raises NoArticleAuthorFound: when an article's author wasn't found.
         """
-        tag_author = article_soup.find("span", class_="river-byline__authors")
+        return self.parse_article_author(
+            TECHCRUNCH_AUTHOR_XPATH(article_tree), article_url
+        )
+
+    def parse_article_author(self, tag_author, article_url):
+        """
+        Gets the author of the article from its matched author elements.
+
+        :param tag_author: List of matched author elements.
+        :param article_url: URL of the article.
+        :return: Author of the article.
+        :raises NoArticleAuthorFound: when an article's author wasn't found.
+        """
         if not tag_author:
             raise NoArticleAuthorFound(
                 "No author found for article: {}".format(article_url)
             )
 
-        return tag_author.get_text().strip()
+        return tag_author[0].text_content().strip()
 
-    def extract_article_content_text(self, article_soup, article_url):
+    def extract_article_content_text(self, article_tree, article_url):
         """
         Extracts the content of the article from the web page.
 
-        :param article_soup: BeautifulSoup object of the web page content.
+        :param article_tree: lxml tree of the web page content.
+        :param article_url: URL of the article.
+        :return: Content of the article.
+        :raises NoArticleContentFound: when an article's content wasn't found.
+        """
+        return self.parse_article_content_text(
+            TECHCRUNCH_CONTENT_XPATH(article_tree), article_url
+        )
+
+    def parse_article_content_text(self, article_content, article_url):
+        """
+        Gets the content of the article from its matched content elements.
+
+        :param article_content: List of matched content elements.
         :param article_url: URL of the article.
         :return: Content of the article.
         :raises NoArticleContentFound: when an article's content wasn't found.
         """
-        article_content = article_soup.find("div", class_="article-content")
         if not article_content:
             logging.warning("Article content element not found.")
             raise NoArticleContentFound(
@@ -249,9 +500,9 @@ class TechCrunchArticles(BaseArticles):
             )
 
         # Extract only individual text paragraphs and concatenate them as the article text
-        article_paragraphs = article_content.find_all("p")
+        article_paragraphs = PARAGRAPHS_XPATH(article_content[0])
         article_text = "\n".join(
-            paragraph.get_text() for paragraph in article_paragraphs
+            paragraph.text_content() for paragraph in article_paragraphs
         )
         return article_text
 
@@ -272,16 +523,16 @@ class TechCrunchArticles(BaseArticles):
 
         return article_id
 
-    def extract_article_urls(self, soup):
+    def extract_article_urls(self, tree):
         """
         Extracts a list of article URLs from the web page.
 
-        :param soup: BeautifulSoup object of the web page content.
+        :param tree: lxml tree of the web page content.
         :return: List of article URLs.
         """
         article_urls = []
 
-        articles = soup.find_all("a", class_="post-block__title__link")
+        articles = TECHCRUNCH_URLS_XPATH(tree)
         article_urls = []
 
         # Extract article URLs and add them to the list
@@ -297,29 +548,140 @@ class TechCrunchArticles(BaseArticles):
 
 # Web page scraper class using Selenium
 class Scraper:
-    def __init__(self):
+    def __init__(self, max_workers=4):
         """
         Initialize the BaseScraper class.
+
+        :param max_workers: Number of threads (and Chrome drivers) used for the
+            Selenium fallback. Plain HTTP fetches are limited by max_connections
+            and the batch size instead.
         """
         self.retry_count = 3
+        self.max_workers = max_workers
+
+        # Plain HTTP request settings, connections are pooled by the aiohttp session
+        self.max_connections = 16
+        self.http_timeout = 10
+        self.http_backoff = 0.2
 
         # Set up the Chrome driver service
         self.service = Service(ChromeDriverManager().install())
 
-    def get_page(self, url, headless=True):
+        # A WebDriver isn't thread-safe, so every thread gets and reuses its own driver
+        self._local = threading.local()
+        self._drivers = []
+        self._drivers_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        # Don't leave Chrome processes behind if close() was never called
+        self.close()
+
+    def _build_options(self, headless=True):
         """
-        Retrieves the web page content using Selenium.
+        Builds the Chrome options used to start a driver.
 
-        :param url: The URL of the web page to scrape.
-        :return: HTML content of the web page.
+        :param headless: Whether to run Chrome in headless mode.
+        :return: Selenium Chrome options.
         """
-        # Set up Selenium options
         options = Options()
         if headless:
             options.add_argument("--headless")  # Run Chrome in headless mode
 
-        # Choose Chrome Browser
-        driver = webdriver.Chrome(service=self.service, options=options)
+        # Only the page HTML is needed, so skip images, stylesheets and fonts
+        options.add_experimental_option("prefs", CHROME_CONTENT_PREFS)
+
+        # Return from driver.get() on DOMContentLoaded instead of the full load event
+        options.page_load_strategy = "eager"
+
+        return options
+
+    def _get_driver(self, headless=True):
+        """
+        Returns the Chrome driver owned by the calling thread, starting it on first use.
+
+        Browser startup costs far more than loading a page, so drivers are kept
+        alive and reused for every subsequent URL, one per headless mode.
+
+        :param headless: Whether to run Chrome in headless mode.
+        :return: Chrome WebDriver instance.
+        """
+        drivers = getattr(self._local, "drivers", None)
+        if drivers is None:
+            drivers = self._local.drivers = {}
+
+        driver = drivers.get(headless)
+        if driver is None:
+            # Choose Chrome Browser
+            driver = webdriver.Chrome(
+                service=self.service, options=self._build_options(headless)
+            )
+            drivers[headless] = driver
+            with self._drivers_lock:
+                self._drivers.append(driver)
+
+        return driver
+
+    def close(self):
+        """
+        Quits every Chrome driver started by this scraper.
+
+        :return: None
+        """
+        if not hasattr(self, "_drivers"):
+            # __init__ failed before any driver could be started
+            return
+
+        with self._drivers_lock:
+            drivers, self._drivers = self._drivers, []
+        self._local = threading.local()
+
+        for driver in drivers:
+            driver.quit()
+
+    async def get_page_http(self, session, url):
+        """
+        Retrieves the web page content with a plain HTTP request.
+
+        :param session: The aiohttp session to send the request with.
+        :param url: The URL of the web page to scrape.
+        :return: HTML content of the web page, or None if the request failed.
+        """
+        for attempt in range(self.retry_count):
+            try:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    return await response.text()
+
+            except aiohttp.ClientResponseError as e:
+                if e.status not in RETRY_STATUSES:
+                    logging.warning("HTTP request failed for {}: {}".format(url, e))
+                    return None
+                logging.warning("HTTP error {} occurred. Retrying...".format(e.status))
+
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                logging.warning("Connection error occurred. Retrying...")
+
+            await asyncio.sleep(self.http_backoff * 2**attempt)
+
+        logging.warning(
+            f"Failed to fetch {url} over HTTP after {self.retry_count} attempts."
+        )
+        return None
+
+    def get_page(self, url, headless=True):
+        """
+        Retrieves the web page content using Selenium.
+
+        :param url: The URL of the web page to scrape.
+        :return: HTML content of the web page.
+        """
+        driver = self._get_driver(headless)
 
         # Retry mechanism to handle connection errors, code will try to connect 3 times
         for _ in range(self.retry_count):
@@ -335,32 +697,53 @@ class Scraper:
                 logging.warning("Connection error occurred. Retrying...")
 
         logging.error(
-            f"Failed to establish connection to news homepage after {self.retry_count} attempts."
+            f"Failed to establish connection to {url} after {self.retry_count} attempts."
         )
-        driver.quit()  # Close the driver to clean up resources if the connection fails
 
-    def scrape(self, url, source):
+    def scrape(self, url, source, data_storage):
         """
-        Scrape articles from a given URL based on the source.
+        Scrape articles from a given URL based on the source and store them.
+
+        Articles are fetched and stored in batches, so only one batch is kept in
+        memory at any time.
 
         :param url: The URL of the web page
         :param source: the source of the articles
-        :return: List of dictionaries, each containing article information.
+        :param data_storage: The DataStorage to store the articles in, articles
+            already stored there are skipped
+        :return: Number of articles scraped.
         """
 
         # Get the HTML content of the web page using the get_page method
         html_content = self.get_page(url, headless=True)
         # Check if the HTML content is None (indicating failure to retrieve the web page)
         if html_content is None:
-            # If there's no content, return empty list indicating no articles were scraped
-            return []
+            # If there's no content, return 0 indicating no articles were scraped
+            return 0
 
         # If source is TECH_CRUNCH, create a TechCrunchArticles object and scrape the articles
         if source == ArticleSource.TECH_CRUNCH:
             articles = TechCrunchArticles()
 
-            return articles.fetch_articles(
-                self, html_content, ArticleSource.TECH_CRUNCH
+            # Keep only the listed articles that aren't stored yet
+            known_ids = data_storage.load_existing_ids()
+            tree = lxml.html.fromstring(html_content, parser=HTML_PARSER)
+            article_urls = [
+                article_url
+                for article_url in articles.extract_article_urls(tree)
+                if articles.extract_article_id(article_url) not in known_ids
+            ]
+            del tree, html_content
+
+            # Every listed article is already stored, so there is nothing to fetch
+            if not article_urls:
+                logging.info("No new articles found for source: {}".format(source))
+                return 0
+
+            return asyncio.run(
+                self.store_articles(
+                    articles, article_urls, ArticleSource.TECH_CRUNCH, data_storage
+                )
             )
 
         # If there is no source match, log a warning and raise a custom exception
@@ -369,89 +752,302 @@ class Scraper:
             "No articles source matched for source: {}".format(source)
         )
 
+    async def store_articles(self, articles, article_urls, source, data_storage):
+        """
+        Fetches articles batch by batch and stores every batch as soon as it's done.
+
+        :param articles: The articles object of the source.
+        :param article_urls: URLs of the articles to fetch.
+        :param source: the source of the articles
+        :param data_storage: The DataStorage to store the articles in.
+        :return: Number of articles scraped.
+        """
+        scraped_count = 0
+
+        # Load the stored IDs and title SimHashes once, every batch updates them
+        existing_articles = data_storage.load_existing_articles()
+        existing_ids = {article_id for article_id, _ in existing_articles}
+        simhash_index = data_storage.build_simhash_index(existing_articles)
+        del existing_articles
+
+        async for articles_data in articles.fetch_articles(self, article_urls, source):
+            # Count only the articles actually stored, after deduplication
+            scraped_count += data_storage.update_data_file(
+                articles_data, existing_ids, simhash_index
+            )
+
+            # Release the batch, and the lxml trees it was extracted from, before
+            # fetching the next one
+            del articles_data
+            gc.collect()
+
+        return scraped_count
+
 
 class DataStorage:
     def __init__(self, filename):
         """
         Initialize the DataStorage class.
 
-        :param filename: Name of the CSV file to store the data.
+        :param filename: Name of the Parquet dataset directory to store the data.
         """
         self.filename = filename
 
-    def load_existing_data(self):
+        # Sidecar file listing the IDs and title SimHashes of the stored articles and of
+        # skipped near-duplicates, one per line.
+        # The leading underscore makes Parquet readers skip it when loading the dataset.
+        self.ids_filename = os.path.join(filename, "_article_ids.txt")
+
+    def load_existing_data(self, columns=None):
         """
-        Loads existing data from the CSV file.
+        Loads existing data from the Parquet dataset.
 
+        :param columns: Columns to load, all of them if None.
         :return: DataFrame containing the existing data.
         """
-        if os.path.exists(self.filename):
-            return pd.read_csv(self.filename)
-        else:
-            return pd.DataFrame(
-                columns=[
-                    "title",
-                    "article_id",
-                    "content",
-                    "url",
-                    "author",
-                    "date_published",
-                    "source",
-                ]
+        if not os.path.exists(self.filename):
+            return pd.DataFrame(columns=columns or ARTICLE_COLUMNS)
+
+        # Parquet is columnar, so only the requested columns are read from disk
+        return pd.read_parquet(self.filename, columns=columns)
+
+    def load_existing_articles(self):
+        """
+        Loads the IDs and title SimHashes of the articles already stored or skipped.
+
+        :return: List of (article_id, simhash) tuples.
+        """
+        if not os.path.exists(self.ids_filename):
+            # Build the sidecar file from the stored data if it went missing
+            existing_data = self.load_existing_data(columns=["article_id", "simhash"])
+            existing_articles = list(
+                zip(existing_data["article_id"], existing_data["simhash"].fillna(""))
             )
+            if existing_articles:
+                self.append_to_ids_file(existing_articles)
+            return existing_articles
+
+        with open(self.ids_filename, encoding="utf-8") as ids_file:
+            return [tuple(line.rstrip("\n").split("\t")) for line in ids_file]
 
-    def save_to_csv(self, df):
+    def load_existing_ids(self):
         """
-        Saves a DataFrame to a CSV file.
+        Loads the IDs of the articles already stored or skipped as near-duplicates.
 
-        :param dataframe: The DataFrame to be saved to CSV.
+        :return: Set of article IDs.
+        """
+        return {article_id for article_id, _ in self.load_existing_articles()}
+
+    def save_to_parquet(self, df):
+        """
+        Saves a DataFrame as a new zstd-compressed part file of the Parquet dataset.
+
+        :param df: The DataFrame to be saved to Parquet.
         :return: None
         """
-        df.to_csv(self.filename, index=False, encoding="utf-8-sig")
+        os.makedirs(self.filename, exist_ok=True)
+        part_filename = os.path.join(
+            self.filename, "part-{}.parquet".format(time.time_ns())
+        )
+        # Keep the column typed as string even when every SimHash is missing, so
+        # all the part files share the same schema
+        df = df.astype({"simhash": "string"})
+        df.to_parquet(part_filename, index=False, compression="zstd")
 
-    def update_csv_file(self, article_data: list):
+    def import_csv(self, csv_filename):
         """
-        Compares new data with existing data and updates the CSV file.
+        Seeds a new dataset with the articles of a CSV file from older versions.
+
+        Nothing is imported if the dataset already exists or the CSV file doesn't.
 
+        :param csv_filename: Name of the CSV file to import.
         :return: None
         """
+        if os.path.exists(self.filename) or not os.path.exists(csv_filename):
+            return
+
+        legacy_data = pd.read_csv(csv_filename, dtype=str)
+
+        # Older CSV files have no SimHashes, so compute them from the titles
+        if "simhash" not in legacy_data:
+            legacy_data["simhash"] = None
+        # Empty titles are read back as NaN, so hash them as empty strings
+        missing = legacy_data["simhash"].isna()
+        legacy_data.loc[missing, "simhash"] = (
+            legacy_data.loc[missing, "title"].fillna("").map(compute_title_simhash)
+        )
+        legacy_data = legacy_data.reindex(columns=ARTICLE_COLUMNS)
 
-        # Load existing data from the CSV file into a DataFrame
-        existing_data = self.load_existing_data()
+        self.save_to_parquet(legacy_data)
+        self.append_to_ids_file(zip(legacy_data["article_id"], legacy_data["simhash"]))
+        logging.info(
+            "Imported {} articles from {}".format(len(legacy_data), csv_filename)
+        )
 
-        # Convert the scraped article data (list of dictionaries) into a new DataFrame
-        new_data = pd.DataFrame(article_data)
+    def export_to_csv(self, csv_filename):
+        """
+        Exports all the stored data to a CSV file.
 
-        # Filter out articles that already exist in the CSV based on their 'article_id'
-        new_data = new_data[~new_data["article_id"].isin(existing_data["article_id"])]
+        :param csv_filename: Name of the CSV file to write.
+        :return: None
+        """
+        self.load_existing_data().to_csv(
+            csv_filename, index=False, encoding="utf-8-sig"
+        )
 
-        # Concatenate the existing data DataFrame and the new data DataFrame to update the data
-        updated_data = pd.concat([existing_data, new_data], ignore_index=True)
+    def append_to_ids_file(self, articles):
+        """
+        Appends article IDs and title SimHashes to the sidecar file.
 
-        # Save the updated DataFrame to the CSV file
-        self.save_to_csv(updated_data)
+        :param articles: Iterable of (article_id, simhash) tuples.
+        :return: None
+        """
+        os.makedirs(self.filename, exist_ok=True)
+        with open(self.ids_filename, "a", encoding="utf-8") as ids_file:
+            for article_id, simhash in articles:
+                # Articles without a title SimHash are stored with an empty one
+                if pd.isna(simhash):
+                    simhash = ""
+                ids_file.write("{}\t{}\n".format(article_id, simhash))
+
+    def build_simhash_index(self, existing_articles):
+        """
+        Builds the index used to look up near-duplicate titles.
 
+        :param existing_articles: List of (article_id, simhash) tuples already stored.
+        :return: SimhashIndex of the articles that have a title SimHash.
+        """
+        return SimhashIndex(
+            [
+                (article_id, Simhash(int(simhash, 16)))
+                for article_id, simhash in existing_articles
+                if simhash
+            ],
+            k=SIMHASH_DISTANCE,
+        )
 
-if __name__ == "__main__":
+    def drop_near_duplicates(self, index, new_data):
+        """
+        Drops new articles whose title is a near-duplicate of another article's title.
+
+        Articles without a title SimHash are never treated as near-duplicates. The
+        articles kept are added to the index.
+
+        :param index: SimhashIndex of the articles already stored.
+        :param new_data: DataFrame containing the newly scraped articles.
+        :return: DataFrame of the new articles that aren't near-duplicates.
+        """
+        keep = []
+        for article_id, simhash in zip(new_data["article_id"], new_data["simhash"]):
+            # Nothing to compare the title on, the article ID check is all there is
+            if pd.isna(simhash):
+                keep.append(True)
+                continue
+
+            title_simhash = Simhash(int(simhash, 16))
+            is_duplicate = bool(index.get_near_dups(title_simhash))
+            if is_duplicate:
+                logging.info("Skipping near-duplicate article: {}".format(article_id))
+            else:
+                # Also catch duplicates within the same scrape
+                index.add(article_id, title_simhash)
+            keep.append(not is_duplicate)
 
+        return new_data.loc[keep]
+
+    def update_data_file(self, article_data: list, existing_ids=None, index=None):
+        """
+        Compares new data with existing data and updates the Parquet dataset.
+
+        Only the sidecar file is read, not the stored articles, but it is read and
+        indexed in full. Callers storing several batches should load existing_ids and
+        index once and pass them in, they are updated with every batch.
+
+        :param article_data: List of dictionaries containing the scraped articles.
+        :param existing_ids: Set of the IDs already stored, loaded if None.
+        :param index: SimhashIndex of the articles already stored, built if None.
+        :return: Number of articles written to the dataset.
+        """
+        # Nothing new was scraped, so there is nothing to add to the dataset
+        if not article_data:
+            return 0
+
+        # Load the IDs and title SimHashes of the articles already stored
+        if existing_ids is None or index is None:
+            existing_articles = self.load_existing_articles()
+            existing_ids = {article_id for article_id, _ in existing_articles}
+            index = self.build_simhash_index(existing_articles)
+
+        # Filter out articles that are already stored based on their 'article_id'
+        # and convert the remaining article data (list of dictionaries) into a DataFrame
+        new_data = pd.DataFrame(
+            [
+                article
+                for article in article_data
+                if article["article_id"] not in existing_ids
+            ]
+        )
+        if new_data.empty:
+            return 0
+
+        # Filter out articles republished under a new slug, based on their title
+        unique_data = self.drop_near_duplicates(index, new_data)
+
+        # Record skipped near-duplicates too, so later scrapes don't fetch them again
+        duplicate_data = new_data.drop(unique_data.index)
+        self.append_to_ids_file(
+            zip(duplicate_data["article_id"], duplicate_data["simhash"])
+        )
+        existing_ids.update(duplicate_data["article_id"])
+        new_data = unique_data
+        if new_data.empty:
+            return 0
+
+        # Write only the new articles instead of rewriting the whole dataset
+        self.save_to_parquet(new_data)
+        self.append_to_ids_file(zip(new_data["article_id"], new_data["simhash"]))
+        existing_ids.update(new_data["article_id"])
+
+        return len(new_data)
+
+
+if __name__ == "__main__":
     # Use argparse to handle command-line arguments
     parser = argparse.ArgumentParser(description="Script with debug mode.")
     parser.add_argument("-v", action="store_true", help="Enable debug mode.")
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of Chrome drivers used when a page needs JavaScript.",
+    )
+    parser.add_argument(
+        "--csv",
+        metavar="CSV_FILE",
+        help="Also export all stored articles to this CSV file.",
+    )
     args = parser.parse_args()
 
     # Set the log level based on the command-line argument
     log_level = logging.DEBUG if args.v else logging.INFO
     logging.basicConfig(level=log_level)
 
-    # Create an instance of the Scraper class
-    scraper = Scraper()
-    # Scrape articles from the TechCrunch website
-    techcrunch_articles_data = scraper.scrape(
-        "https://techcrunch.com/", ArticleSource.TECH_CRUNCH
-    )
+    # Create an instance of the DataStorage class with the specified dataset name
+    data_storage = DataStorage("TechCrunch_latest_news.parquet")
+
+    # Carry over the articles scraped before the data moved to Parquet
+    data_storage.import_csv("TechCrunch_latest_news.csv")
 
-    # Create an instance of the DataStorage class with the specified CSV file name
-    data_storage = DataStorage("TechCrunch_latest_news.csv")
+    # Create an instance of the Scraper class
+    # The Chrome drivers are quit once every page has been fetched
+    with Scraper(max_workers=args.workers) as scraper:
+        # Scrape new articles from the TechCrunch website and store them in batches
+        scraped_count = scraper.scrape(
+            "https://techcrunch.com/", ArticleSource.TECH_CRUNCH, data_storage
+        )
+    logging.info("Scraped {} new articles".format(scraped_count))
 
-    # Call the update_csv_file() method to update the CSV file
-    data_storage.update_csv_file(techcrunch_articles_data)
+    # Export the stored articles to CSV, e.g. as input for site_summarizer.py
+    if args.csv:
+        data_storage.export_to_csv(args.csv)